@@ -11,3 +11,5 @@ PROJECT_NAME: str = "docTR API template"
 PROJECT_DESCRIPTION: str = "Template API for Optical Character Recognition"
 VERSION: str = doctr.__version__
 DEBUG: bool = os.environ.get("DEBUG", "") != "False"
+# Dynamic INT8 quantization of the recognition model, only applied when running on CPU
+QUANTIZE_RECOGNITION: bool = os.environ.get("QUANTIZE_RECOGNITION", "") == "True"
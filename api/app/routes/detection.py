@@ -5,10 +5,11 @@
 
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.schemas import DetectionIn, DetectionOut
 from app.utils import get_documents, resolve_geometry
-from app.vision import init_predictor
+from app.vision import init_predictor, predict
 from doctr.file_utils import CLASS_NAME
 
 router = APIRouter()
@@ -18,11 +19,12 @@ router = APIRouter()
 async def text_detection(request: DetectionIn = Depends(), files: list[UploadFile] = [File(...)]):
     """Runs docTR text detection model to analyze the input image"""
     try:
-        predictor = init_predictor(request)
+        predictor = await run_in_threadpool(init_predictor, request)
         content, filenames = await get_documents(files)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    out = await run_in_threadpool(predict, predictor, request, content)
     return [
         DetectionOut(
             name=filename,
@@ -31,5 +33,5 @@ async def text_detection(request: DetectionIn = Depends(), files: list[UploadFil
                 for geom in doc[CLASS_NAME]
             ],
         )
-        for doc, filename in zip(predictor(content), filenames)
+        for doc, filename in zip(out, filenames)
     ]
@@ -5,10 +5,11 @@
 
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.schemas import KIEElement, KIEIn, KIEOut
 from app.utils import get_documents, resolve_geometry
-from app.vision import init_predictor
+from app.vision import init_predictor, predict
 
 router = APIRouter()
 
@@ -17,12 +18,12 @@ router = APIRouter()
 async def perform_kie(request: KIEIn = Depends(), files: list[UploadFile] = [File(...)]):
     """Runs docTR KIE model to analyze the input image"""
     try:
-        predictor = init_predictor(request)
+        predictor = await run_in_threadpool(init_predictor, request)
         content, filenames = await get_documents(files)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    out = predictor(content)
+    out = await run_in_threadpool(predict, predictor, request, content)
 
     results = [
         KIEOut(
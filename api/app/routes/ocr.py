@@ -5,10 +5,11 @@
 
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.schemas import OCRBlock, OCRIn, OCRLine, OCROut, OCRPage, OCRWord
 from app.utils import get_documents, resolve_geometry
-from app.vision import init_predictor
+from app.vision import init_predictor, predict
 
 router = APIRouter()
 
@@ -19,11 +20,11 @@ async def perform_ocr(request: OCRIn = Depends(), files: list[UploadFile] = [Fil
     try:
         # generator object to list
         content, filenames = await get_documents(files)
-        predictor = init_predictor(request)
+        predictor = await run_in_threadpool(init_predictor, request)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    out = predictor(content)
+    out = await run_in_threadpool(predict, predictor, request, content)
 
     results = [
         OCROut(
@@ -5,10 +5,11 @@
 
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.schemas import RecognitionIn, RecognitionOut
 from app.utils import get_documents
-from app.vision import init_predictor
+from app.vision import init_predictor, predict
 
 router = APIRouter()
 
@@ -19,11 +20,15 @@ router = APIRouter()
 async def text_recognition(request: RecognitionIn = Depends(), files: list[UploadFile] = [File(...)]):
     """Runs docTR text recognition model to analyze the input image"""
     try:
-        predictor = init_predictor(request)
+        # Building the predictor (on the first request for this configuration) loads weights, keep it off the event loop
+        predictor = await run_in_threadpool(init_predictor, request)
         content, filenames = await get_documents(files)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+    # All crops of the request go through the predictor as a single batched call, off the event loop
+    out = await run_in_threadpool(predict, predictor, request, content)
     return [
         RecognitionOut(name=filename, value=res[0], confidence=round(res[1], 2))
-        for res, filename in zip(predictor(content), filenames)
+        for res, filename in zip(out, filenames)
     ]
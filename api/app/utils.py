@@ -4,13 +4,18 @@
 # See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
 
 
+from threading import Lock
 from typing import Any
 
 import numpy as np
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 
 from doctr.io import DocumentFile
 
+# PDFium is not thread-safe, PDF uploads decoded from the thread pool must not be rasterized concurrently
+_PDF_LOCK = Lock()
+
 
 def resolve_geometry(
     geom: Any,
@@ -20,6 +25,11 @@ def resolve_geometry(
     return (*geom[0], *geom[1])
 
 
+def _read_pdf(content: bytes) -> list[np.ndarray]:  # pragma: no cover
+    with _PDF_LOCK:
+        return DocumentFile.from_pdf(content)
+
+
 async def get_documents(files: list[UploadFile]) -> tuple[list[np.ndarray], list[str]]:  # pragma: no cover
     """Convert a list of UploadFile objects to lists of numpy arrays and their corresponding filenames
 
@@ -34,11 +44,12 @@ async def get_documents(files: list[UploadFile]) -> tuple[list[np.ndarray], list
     docs = []
     for file in files:
         mime_type = file.content_type
+        # Decoding is CPU-bound (cv2.imdecode / pdfium), so keep it off the event loop
         if mime_type in ["image/jpeg", "image/png"]:
-            docs.extend(DocumentFile.from_images([await file.read()]))
+            docs.extend(await run_in_threadpool(DocumentFile.from_images, [await file.read()]))
             filenames.append(file.filename or "")
         elif mime_type == "application/pdf":
-            pdf_content = DocumentFile.from_pdf(await file.read())
+            pdf_content = await run_in_threadpool(_read_pdf, await file.read())
             docs.extend(pdf_content)
             filenames.extend([file.filename] * len(pdf_content) or [""] * len(pdf_content))
         else:
@@ -5,13 +5,24 @@
 
 
 from collections.abc import Callable
+from functools import lru_cache
+from threading import Lock
+from typing import Any
+from weakref import WeakKeyDictionary
 
 import torch
 
 from doctr.models import kie_predictor, ocr_predictor
 
+from . import config as cfg
 from .schemas import DetectionIn, KIEIn, OCRIn, RecognitionIn
 
+# Predictors may be requested concurrently from worker threads, make sure each one is only built once
+_INIT_LOCK = Lock()
+# Cached predictors are shared between requests, each one gets a lock to run with the thresholds of a single request
+_PREDICTION_LOCKS: WeakKeyDictionary = WeakKeyDictionary()
+_POSTPROCESSING_PARAMS = ("bin_thresh", "box_thresh")
+
 
 def _move_to_device(predictor: Callable) -> Callable:
     """Move the predictor to the desired device
@@ -25,6 +36,22 @@ def _move_to_device(predictor: Callable) -> Callable:
     return predictor.to(torch.device("cuda" if torch.cuda.is_available() else "cpu"))
 
 
+def _quantize(predictor: Callable) -> Callable:
+    """Quantize the linear & recurrent layers of the predictor's model to INT8 (CPU only)
+
+    Args:
+        predictor: the recognition predictor to quantize
+
+    Returns:
+        Callable: the quantized predictor
+    """
+    if cfg.QUANTIZE_RECOGNITION and not torch.cuda.is_available():
+        predictor.model = torch.ao.quantization.quantize_dynamic(
+            predictor.model, {torch.nn.Linear, torch.nn.LSTM, torch.nn.GRU}, dtype=torch.qint8
+        )
+    return predictor
+
+
 def init_predictor(request: KIEIn | OCRIn | RecognitionIn | DetectionIn) -> Callable:
     """Initialize the predictor based on the request
 
@@ -35,19 +62,58 @@ def init_predictor(request: KIEIn | OCRIn | RecognitionIn | DetectionIn) -> Call
         Callable: the predictor
     """
     params = request.model_dump()
-    bin_thresh = params.pop("bin_thresh", None)
-    box_thresh = params.pop("box_thresh", None)
-    if isinstance(request, (OCRIn, RecognitionIn, DetectionIn)):
+    # Thresholds only affect the post-processing, so they are kept out of the cache key and set by `predict`
+    for name in _POSTPROCESSING_PARAMS:
+        params.pop(name, None)
+    # Requests are not hashable, so the cache is keyed on the request type and its frozen parameters
+    with _INIT_LOCK:
+        predictor = _init_predictor(type(request), tuple(sorted(params.items())))
+        _PREDICTION_LOCKS.setdefault(predictor, Lock())
+    return predictor
+
+
+def predict(predictor: Callable, request: KIEIn | OCRIn | RecognitionIn | DetectionIn, content: Any) -> Any:
+    """Run the predictor with the post-processing thresholds of the request
+
+    Args:
+        predictor: the predictor returned by `init_predictor` for this request
+        request: input request
+        content: the documents to analyze
+
+    Returns:
+        Any: the output of the predictor
+    """
+    thresholds = {name: getattr(request, name) for name in _POSTPROCESSING_PARAMS if hasattr(request, name)}
+    if not thresholds:
+        return predictor(content)
+    postprocessor = getattr(predictor, "det_predictor", predictor).model.postprocessor
+    # The thresholds must not be changed by another request until this prediction is done
+    with _PREDICTION_LOCKS[predictor]:
+        for name, value in thresholds.items():
+            setattr(postprocessor, name, value)
+        return predictor(content)
+
+
+@lru_cache(maxsize=8)
+def _init_predictor(
+    request_type: type[KIEIn | OCRIn | RecognitionIn | DetectionIn], frozen_params: tuple[tuple[str, object], ...]
+) -> Callable:
+    """Build the predictor once per distinct model configuration
+
+    Args:
+        request_type: type of the input request
+        frozen_params: sorted (name, value) pairs of the request parameters, post-processing thresholds excluded
+
+    Returns:
+        Callable: the predictor
+    """
+    params = dict(frozen_params)
+    if issubclass(request_type, (OCRIn, RecognitionIn, DetectionIn)):
         predictor = ocr_predictor(pretrained=True, **params)
-        predictor.det_predictor.model.postprocessor.bin_thresh = bin_thresh
-        predictor.det_predictor.model.postprocessor.box_thresh = box_thresh
-        if isinstance(request, DetectionIn):
+        if issubclass(request_type, DetectionIn):
             return _move_to_device(predictor.det_predictor)
-        elif isinstance(request, RecognitionIn):
-            return _move_to_device(predictor.reco_predictor)
-        return _move_to_device(predictor)
-    elif isinstance(request, KIEIn):
-        predictor = kie_predictor(pretrained=True, **params)
-        predictor.det_predictor.model.postprocessor.bin_thresh = bin_thresh
-        predictor.det_predictor.model.postprocessor.box_thresh = box_thresh
+        elif issubclass(request_type, RecognitionIn):
+            return _quantize(_move_to_device(predictor.reco_predictor))
         return _move_to_device(predictor)
+    elif issubclass(request_type, KIEIn):
+        return _move_to_device(kie_predictor(pretrained=True, **params))
@@ -1,5 +1,12 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import torch
+
+from app import config as cfg
 from app.schemas import DetectionIn, KIEIn, OCRIn, RecognitionIn
-from app.vision import init_predictor
+from app.vision import _init_predictor, init_predictor, predict
 from doctr.models.detection.predictor import DetectionPredictor
 from doctr.models.kie_predictor import KIEPredictor
 from doctr.models.predictor import OCRPredictor
@@ -11,3 +18,52 @@ def test_vision():
     assert isinstance(init_predictor(DetectionIn()), DetectionPredictor)
     assert isinstance(init_predictor(RecognitionIn()), RecognitionPredictor)
     assert isinstance(init_predictor(KIEIn()), KIEPredictor)
+
+
+def _mock_forward(self, pages, **kwargs):
+    # Reports the thresholds seen at the start & at the end of the prediction
+    thresholds = (self.model.postprocessor.bin_thresh, self.model.postprocessor.box_thresh)
+    time.sleep(0.05)
+    return [thresholds, (self.model.postprocessor.bin_thresh, self.model.postprocessor.box_thresh)]
+
+
+def test_init_predictor_cache(monkeypatch):
+    monkeypatch.setattr(DetectionPredictor, "forward", _mock_forward)
+    # Identical requests share the same predictor
+    assert init_predictor(DetectionIn()) is init_predictor(DetectionIn())
+    assert init_predictor(OCRIn()) is init_predictor(OCRIn())
+    # Changing the thresholds does not rebuild the model, they are applied to the cached predictor by `predict`
+    misses = _init_predictor.cache_info().misses
+    request = DetectionIn(bin_thresh=0.3, box_thresh=0.2)
+    predictor = init_predictor(request)
+    assert predictor is init_predictor(DetectionIn())
+    assert predict(predictor, request, []) == [(0.3, 0.2), (0.3, 0.2)]
+    assert init_predictor(OCRIn(bin_thresh=0.4, box_thresh=0.2)) is init_predictor(OCRIn())
+    assert _init_predictor.cache_info().misses == misses
+
+
+def test_predict_concurrent_thresholds(monkeypatch):
+    monkeypatch.setattr(DetectionPredictor, "forward", _mock_forward)
+    requests = [DetectionIn(bin_thresh=0.1 * idx, box_thresh=0.05 * idx) for idx in range(1, 5)]
+    predictors = [init_predictor(request) for request in requests]
+    assert all(predictor is predictors[0] for predictor in predictors)
+    with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+        outs = list(executor.map(predict, predictors, requests, [[]] * len(requests)))
+    # Each request keeps its own thresholds for the whole prediction, although the predictor is shared
+    for out, request in zip(outs, requests):
+        assert out == [(request.bin_thresh, request.box_thresh)] * 2
+
+
+@pytest.mark.skipif(torch.cuda.is_available(), reason="quantization is only applied on CPU")
+def test_init_predictor_quantization(monkeypatch):
+    monkeypatch.setattr(cfg, "QUANTIZE_RECOGNITION", True)
+    _init_predictor.cache_clear()
+    try:
+        predictor = init_predictor(RecognitionIn(reco_arch="crnn_vgg16_bn"))
+        modules = list(predictor.model.modules())
+        assert any(isinstance(module, torch.ao.nn.quantized.dynamic.Linear) for module in modules)
+        assert any(isinstance(module, torch.ao.nn.quantized.dynamic.LSTM) for module in modules)
+        assert not any(type(module) in (torch.nn.Linear, torch.nn.LSTM) for module in modules)
+    finally:
+        # Don't leak the quantized predictor to the other tests
+        _init_predictor.cache_clear()
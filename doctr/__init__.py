@@ -1,3 +1,20 @@
-from . import io, models, datasets, contrib, transforms, utils
+import importlib as _importlib
+from typing import Any as _Any
+
 from .file_utils import is_tf_available, is_torch_available
 from .version import __version__  # noqa: F401
+
+# Submodules are imported on first access, so that `import doctr` does not load the whole model zoo
+_SUBMODULES = ("io", "models", "datasets", "contrib", "transforms", "utils")
+
+
+def __getattr__(name: str) -> _Any:
+    if name in _SUBMODULES:
+        module = _importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SUBMODULES})
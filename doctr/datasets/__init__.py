@@ -1,5 +1,8 @@
 from doctr.file_utils import is_tf_available
 
+# NOTE: vocabs & utils come first, as doctr.models (imported by the dataset modules) relies on them
+from .vocabs import *
+from .utils import *
 from .generator import *
 from .cord import *
 from .detection import *
@@ -18,8 +21,6 @@ from .sroie import *
 from .svhn import *
 from .svt import *
 from .synthtext import *
-from .utils import *
-from .vocabs import *
 from .wildreceipt import *
 
 if is_tf_available():
@@ -6,20 +6,74 @@
 import glob
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import cv2
 import numpy as np
 from PIL import Image
 from tqdm import tqdm
 
+from doctr.utils.multithreading import multithread_exec
+
 from .datasets import AbstractDataset
 from .utils import convert_target_to_relative, crop_bboxes_from_image
 
 __all__ = ["IMGUR5K"]
 
 
+def _box_points(boxes: np.ndarray) -> np.ndarray:
+    """Vectorized equivalent of `cv2.boxPoints` applied to each rotated box
+
+    Args:
+        boxes: array of shape (N, 5) with x_center, y_center, width, height, angle (in degrees)
+
+    Returns:
+        array of shape (N, 4, 2) with the corners of each box
+    """
+    angle = np.deg2rad(boxes[:, 4])
+    cos, sin = 0.5 * np.cos(angle), 0.5 * np.sin(angle)
+    centers, w, h = boxes[:, :2], boxes[:, 2], boxes[:, 3]
+    # First two corners, the remaining ones are their reflection through the center
+    pt0 = np.stack((-sin * h - cos * w, cos * h - sin * w), axis=-1)
+    pt1 = np.stack((sin * h - cos * w, -cos * h - sin * w), axis=-1)
+    return centers[:, None] + np.stack((pt0, pt1, -pt0, -pt1), axis=1)
+
+
+@lru_cache(maxsize=2)
+def _load_annotations(label_path: str, mtime: float) -> dict[str, Any]:
+    """Parse the annotation file, so that the train and test subsets share the same parsed content
+
+    Args:
+        label_path: path to the annotations file
+        mtime: last modification time of the file, to invalidate the cache on changes
+
+    Returns:
+        the parsed annotations
+    """
+    with open(label_path) as f:
+        return json.load(f)
+
+
+def _save_crops(prefix: str, img_path: str, geoms: np.ndarray, labels: list[str], folder: str) -> None:
+    """Crop the boxes of an image and write each crop along with its label to disk
+
+    Args:
+        prefix: unique prefix of the file names for this image
+        img_path: path to the image
+        geoms: boxes to crop
+        labels: labels of the boxes
+        folder: folder to write the crops to
+    """
+    crops = crop_bboxes_from_image(img_path=img_path, geoms=geoms)
+    for idx, (crop, label) in enumerate(zip(crops, labels)):
+        if crop.shape[0] > 0 and crop.shape[1] > 0 and len(label) > 0:
+            # write data to disk
+            with open(os.path.join(folder, f"{prefix}_{idx}.txt"), "w") as f:
+                f.write(label)
+            Image.fromarray(crop).save(os.path.join(folder, f"{prefix}_{idx}.png"))
+
+
 class IMGUR5K(AbstractDataset):
     """IMGUR5K dataset from `"TextStyleBrush: Transfer of Text Aesthetics from a Single Example"
     <https://arxiv.org/abs/2106.08385>`_ |
@@ -76,15 +130,17 @@ class IMGUR5K(AbstractDataset):
         self.train = train
         np_dtype = np.float32
 
-        img_names = os.listdir(img_folder)
+        # sorted so that the train/test split does not depend on the filesystem listing order
+        img_names = sorted(os.listdir(img_folder))
         train_samples = int(len(img_names) * 0.9)
-        set_slice = slice(train_samples) if self.train else slice(train_samples, None)
+        img_names = img_names[:train_samples] if self.train else img_names[train_samples:]
 
         # define folder to write IMGUR5K recognition dataset
         reco_folder_name = "IMGUR5K_recognition_train" if self.train else "IMGUR5K_recognition_test"
         reco_folder_name = "Poly_" + reco_folder_name if use_polygons else reco_folder_name
         reco_folder_path = os.path.join(os.path.dirname(self.root), reco_folder_name)
-        reco_images_counter = 0
+        # (image id, image path, boxes, labels) of the images to crop for the recognition task
+        reco_samples: list[tuple[str, str, np.ndarray, list[str]]] = []
 
         if recognition_task and os.path.isdir(reco_folder_path):
             self._read_from_folder(reco_folder_path)
@@ -92,58 +148,45 @@ class IMGUR5K(AbstractDataset):
         elif recognition_task and not os.path.isdir(reco_folder_path):
             os.makedirs(reco_folder_path, exist_ok=False)
 
-        with open(label_path) as f:
-            annotation_file = json.load(f)
+        annotation_file = _load_annotations(label_path, os.path.getmtime(label_path))
+        ann_map, anns = annotation_file["index_to_ann_map"], annotation_file["ann_id"]
 
-        for img_name in tqdm(iterable=img_names[set_slice], desc="Unpacking IMGUR5K", total=len(img_names[set_slice])):
+        for img_name in tqdm(iterable=img_names, desc="Unpacking IMGUR5K", total=len(img_names)):
             img_path = Path(img_folder, img_name)
             img_id = img_name.split(".")[0]
 
-            # File existence check
-            if not os.path.exists(os.path.join(self.root, img_name)):
-                raise FileNotFoundError(f"unable to locate {os.path.join(self.root, img_name)}")
-
             # some files have no annotations which are marked with only a dot in the 'word' key
             # ref: https://github.com/facebookresearch/IMGUR5K-Handwriting-Dataset/blob/main/README.md
-            if img_id not in annotation_file["index_to_ann_map"].keys():
+            if img_id not in ann_map:
                 continue
-            ann_ids = annotation_file["index_to_ann_map"][img_id]
-            annotations = [annotation_file["ann_id"][a_id] for a_id in ann_ids]
+            annotations = [anns[a_id] for a_id in ann_map[img_id]]
 
             labels = [ann["word"] for ann in annotations if ann["word"] != "."]
-            # x_center, y_center, width, height, angle
-            _boxes = [
-                list(map(float, ann["bounding_box"].strip("[ ]").split(", ")))
-                for ann in annotations
-                if ann["word"] != "."
-            ]
-            # (x, y) coordinates of top left, top right, bottom right, bottom left corners
-            box_targets = [cv2.boxPoints(((box[0], box[1]), (box[2], box[3]), box[4])) for box in _boxes]
+            # x_center, y_center, width, height, angle (all the boxes of the image are parsed at once)
+            _boxes = np.fromstring(
+                ",".join(ann["bounding_box"].strip("[ ]") for ann in annotations if ann["word"] != "."),
+                dtype=np_dtype,
+                sep=",",
+            ).reshape(-1, 5)
+            # (x, y) coordinates of the 4 corners (same ordering as cv2.boxPoints), already float32
+            box_targets = _box_points(_boxes)
 
             if not use_polygons:
                 # xmin, ymin, xmax, ymax
-                box_targets = [np.concatenate((points.min(0), points.max(0)), axis=-1) for points in box_targets]
+                box_targets = np.concatenate((box_targets.min(1), box_targets.max(1)), axis=-1)
 
             # filter images without boxes
             if len(box_targets) > 0:
                 if recognition_task:
-                    crops = crop_bboxes_from_image(
-                        img_path=os.path.join(self.root, img_name), geoms=np.asarray(box_targets, dtype=np_dtype)
-                    )
-                    for crop, label in zip(crops, labels):
-                        if crop.shape[0] > 0 and crop.shape[1] > 0 and len(label) > 0:
-                            # write data to disk
-                            with open(os.path.join(reco_folder_path, f"{reco_images_counter}.txt"), "w") as f:
-                                f.write(label)
-                                tmp_img = Image.fromarray(crop)
-                                tmp_img.save(os.path.join(reco_folder_path, f"{reco_images_counter}.png"))
-                                reco_images_counter += 1
+                    reco_samples.append((img_id, os.path.join(self.root, img_name), box_targets, labels))
                 elif detection_task:
-                    self.data.append((img_path, np.asarray(box_targets, dtype=np_dtype)))
+                    self.data.append((img_path, box_targets))
                 else:
-                    self.data.append((img_path, dict(boxes=np.asarray(box_targets, dtype=np_dtype), labels=labels)))
+                    self.data.append((img_path, dict(boxes=box_targets, labels=labels)))
 
         if recognition_task:
+            # Image decoding & crop encoding release the GIL, so the images can be processed concurrently
+            list(multithread_exec(lambda sample: _save_crops(*sample, folder=reco_folder_path), reco_samples))
             self._read_from_folder(reco_folder_path)
 
     def extra_repr(self) -> str:
@@ -60,7 +60,11 @@ class DocumentBuilder(NestedObject):
                 min_angle=5.0,
             )
             boxes = np.concatenate((boxes.min(1), boxes.max(1)), -1)
-        return (boxes[:, 0] + 2 * boxes[:, 3] / np.median(boxes[:, 3] - boxes[:, 1])).argsort(), boxes
+        # Degenerate boxes (null median height) would otherwise yield inf/nan sort keys
+        y_med = np.median(boxes[:, 3] - boxes[:, 1]) or 1.0
+        sort_keys = 2 * boxes[:, 3] / y_med
+        sort_keys += boxes[:, 0]
+        return sort_keys.argsort(), boxes
 
     def _resolve_sub_lines(self, boxes: np.ndarray, word_idcs: list[int]) -> list[list[int]]:
         """Split a line in sub_lines
@@ -72,33 +76,18 @@ class DocumentBuilder(NestedObject):
         Returns:
             A list of (sub-)lines computed from the original line (words)
         """
-        lines = []
         # Sort words horizontally
         word_idcs = [word_idcs[idx] for idx in boxes[word_idcs, 0].argsort().tolist()]
 
         # Eventually split line horizontally
         if len(word_idcs) < 2:
-            lines.append(word_idcs)
-        else:
-            sub_line = [word_idcs[0]]
-            for i in word_idcs[1:]:
-                horiz_break = True
-
-                prev_box = boxes[sub_line[-1]]
-                # Compute distance between boxes
-                dist = boxes[i, 0] - prev_box[2]
-                # If distance between boxes is lower than paragraph break, same sub-line
-                if dist < self.paragraph_break:
-                    horiz_break = False
+            return [word_idcs]
+        # Compute distance between consecutive boxes
+        dists = boxes[word_idcs[1:], 0] - boxes[word_idcs[:-1], 2]
+        # If distance between boxes is lower than paragraph break, same sub-line
+        breaks = (np.flatnonzero(~(dists < self.paragraph_break)) + 1).tolist()
 
-                if horiz_break:
-                    lines.append(sub_line)
-                    sub_line = []
-
-                sub_line.append(i)
-            lines.append(sub_line)
-
-        return lines
+        return [word_idcs[start:end] for start, end in zip([0, *breaks], [*breaks, len(word_idcs)])]
 
     def _resolve_lines(self, boxes: np.ndarray) -> list[list[int]]:
         """Order boxes to group them in lines
@@ -114,17 +103,19 @@ class DocumentBuilder(NestedObject):
 
         # Compute median for boxes heights
         y_med = np.median(boxes[:, 3] - boxes[:, 1])
+        # Compute all y-centers at once
+        y_centers = ((boxes[:, 1] + boxes[:, 3]) / 2).tolist()
 
         lines = []
         words = [idxs[0]]  # Assign the top-left word to the first line
         # Define a mean y-center for the line
-        y_center_sum = boxes[idxs[0]][[1, 3]].mean()
+        y_center_sum = y_centers[idxs[0]]
 
         for idx in idxs[1:]:
             vert_break = True
 
             # Compute y_dist
-            y_dist = abs(boxes[idx][[1, 3]].mean() - y_center_sum / len(words))
+            y_dist = abs(y_centers[idx] - y_center_sum / len(words))
             # If y-center of the box is close enough to mean y-center of the line, same line
             if y_dist < y_med / 2:
                 vert_break = False
@@ -136,7 +127,7 @@ class DocumentBuilder(NestedObject):
                 y_center_sum = 0
 
             words.append(idx)
-            y_center_sum += boxes[idx][[1, 3]].mean()
+            y_center_sum += y_centers[idx]
 
         # Use the remaining words to form the last(s) line(s)
         if len(words) > 0:
@@ -250,19 +241,21 @@ class DocumentBuilder(NestedObject):
             lines = [self._sort_boxes(_boxes if _boxes.ndim == 3 else _boxes[:, :4])[0]]  # type: ignore[list-item]
             _blocks = [lines]
 
+        # Convert to Python floats in a single pass instead of boxing scalars box by box
+        box_list = boxes.tolist()
         blocks = [
             Block([
                 Line([
                     Word(
                         *word_preds[idx],
-                        tuple(tuple(pt) for pt in boxes[idx].tolist()),  # type: ignore[arg-type]
+                        tuple(tuple(pt) for pt in box_list[idx]),  # type: ignore[arg-type]
                         float(objectness_scores[idx]),
                         crop_orientations[idx],
                     )
                     if boxes.ndim == 3
                     else Word(
                         *word_preds[idx],
-                        ((boxes[idx, 0], boxes[idx, 1]), (boxes[idx, 2], boxes[idx, 3])),
+                        ((box_list[idx][0], box_list[idx][1]), (box_list[idx][2], box_list[idx][3])),
                         float(objectness_scores[idx]),
                         crop_orientations[idx],
                     )
@@ -478,11 +471,12 @@ class KIEDocumentBuilder(DocumentBuilder):
         # Decide whether we try to form lines
         _boxes = boxes
         idxs, _ = self._sort_boxes(_boxes if _boxes.ndim == 3 else _boxes[:, :4])
+        box_list = boxes.tolist()
         predictions = [
             Prediction(
                 value=word_preds[idx][0],
                 confidence=word_preds[idx][1],
-                geometry=tuple(tuple(pt) for pt in boxes[idx].tolist()),  # type: ignore[arg-type]
+                geometry=tuple(tuple(pt) for pt in box_list[idx]),  # type: ignore[arg-type]
                 objectness_score=float(objectness_scores[idx]),
                 crop_orientation=crop_orientations[idx],
             )
@@ -490,7 +484,7 @@ class KIEDocumentBuilder(DocumentBuilder):
             else Prediction(
                 value=word_preds[idx][0],
                 confidence=word_preds[idx][1],
-                geometry=((boxes[idx, 0], boxes[idx, 1]), (boxes[idx, 2], boxes[idx, 3])),
+                geometry=((box_list[idx][0], box_list[idx][1]), (box_list[idx][2], box_list[idx][3])),
                 objectness_score=float(objectness_scores[idx]),
                 crop_orientation=crop_orientations[idx],
             )
@@ -7,6 +7,7 @@
 import cv2
 import numpy as np
 
+from doctr.utils.multithreading import multithread_exec
 from doctr.utils.repr import NestedObject
 
 __all__ = ["DetectionPostProcessor"]
@@ -45,17 +46,20 @@ class DetectionPostProcessor(NestedObject):
         h, w = pred.shape[:2]
 
         if assume_straight_pages:
-            xmin = np.clip(np.floor(points[:, 0].min()).astype(np.int32), 0, w - 1)
-            xmax = np.clip(np.ceil(points[:, 0].max()).astype(np.int32), 0, w - 1)
-            ymin = np.clip(np.floor(points[:, 1].min()).astype(np.int32), 0, h - 1)
-            ymax = np.clip(np.ceil(points[:, 1].max()).astype(np.int32), 0, h - 1)
+            # Bounds are clipped as Python scalars, numpy calls dominate the cost for small boxes
+            (xmin, ymin), (xmax, ymax) = np.floor(points.min(axis=0)).tolist(), np.ceil(points.max(axis=0)).tolist()
+            xmin, xmax = min(max(int(xmin), 0), w - 1), min(max(int(xmax), 0), w - 1)
+            ymin, ymax = min(max(int(ymin), 0), h - 1), min(max(int(ymax), 0), h - 1)
             return pred[ymin : ymax + 1, xmin : xmax + 1].mean()
 
         else:
-            mask: np.ndarray = np.zeros((h, w), np.int32)
-            cv2.fillPoly(mask, [points.astype(np.int32)], 1.0)  # type: ignore[call-overload]
-            product = pred * mask
-            return np.sum(product) / np.count_nonzero(product)
+            # Only rasterize the polygon over its bounding box
+            pts = points.astype(np.int32).reshape(-1, 2)
+            xmin, ymin = pts.min(axis=0).clip(0, (w - 1, h - 1)).tolist()
+            xmax, ymax = pts.max(axis=0).clip(0, (w - 1, h - 1)).tolist()
+            mask: np.ndarray = np.zeros((ymax - ymin + 1, xmax - xmin + 1), np.uint8)
+            cv2.fillPoly(mask, [pts - (xmin, ymin)], 1)  # type: ignore[call-overload]
+            return pred[ymin : ymax + 1, xmin : xmax + 1][mask.astype(bool)].mean()
 
     def bitmap_to_boxes(
         self,
@@ -80,16 +84,23 @@ class DetectionPostProcessor(NestedObject):
         if proba_map.ndim != 4:
             raise AssertionError(f"arg `proba_map` is expected to be 4-dimensional, got {proba_map.ndim}.")
 
-        # Erosion + dilation on the binary map
-        bin_map = [
-            [
-                cv2.morphologyEx(bmap[..., idx], cv2.MORPH_OPEN, self._opening_kernel)
-                for idx in range(proba_map.shape[-1])
-            ]
-            for bmap in (proba_map >= self.bin_thresh).astype(np.uint8)
-        ]
+        # Samples are processed concurrently (OpenCV releases the GIL)
+        return list(multithread_exec(self._postprocess_sample, proba_map))
+
+    def _postprocess_sample(self, pmaps: np.ndarray) -> list[np.ndarray]:
+        """Performs postprocessing for a single model output
+
+        Args:
+            pmaps: probability map of shape (H, W, C)
 
+        Returns:
+            list of C tensors of shape (*, 5) or (*, 6)
+        """
+        bmaps = (pmaps >= self.bin_thresh).astype(np.uint8)
+        # Erosion + dilation on the binary map
         return [
-            [self.bitmap_to_boxes(pmaps[..., idx], bmaps[idx]) for idx in range(proba_map.shape[-1])]
-            for pmaps, bmaps in zip(proba_map, bin_map)
+            self.bitmap_to_boxes(
+                pmaps[..., idx], cv2.morphologyEx(bmaps[..., idx], cv2.MORPH_OPEN, self._opening_kernel)
+            )
+            for idx in range(pmaps.shape[-1])
         ]
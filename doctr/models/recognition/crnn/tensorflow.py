@@ -145,7 +145,8 @@ class CRNN(RecognitionModel, Model):
         self.decoder = Sequential([
             layers.Bidirectional(layers.LSTM(units=rnn_units, return_sequences=True)),
             layers.Bidirectional(layers.LSTM(units=rnn_units, return_sequences=True)),
-            layers.Dense(units=len(vocab) + 1),
+            # Keep the logits in float32 under mixed precision policies for a numerically stable CTC
+            layers.Dense(units=len(vocab) + 1, dtype="float32"),
         ])
         self.decoder.build(input_shape=(None, w, h * c))
 
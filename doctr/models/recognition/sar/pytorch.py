@@ -74,7 +74,7 @@ class AttentionModule(nn.Module):
         # (N, H, W) --> (N, 1, H, W)
         attention_weights = torch.softmax(attention_weights.view(B, -1), dim=-1).view(B, C, H, W)
         # fuse features and attention weights (N, C)
-        return (features * attention_weights).sum(dim=(2, 3))
+        return torch.einsum("nchw,nkhw->nc", features, attention_weights)
 
 
 class SARDecoder(nn.Module):
@@ -87,7 +87,6 @@ class AttentionModule(layers.Layer, NestedObject):
             padding="same",
             kernel_initializer="he_normal",
         )
-        self.flatten = layers.Flatten()
 
     def call(
         self,
@@ -104,14 +103,10 @@ class AttentionModule(layers.Layer, NestedObject):
         projection = tf.math.tanh(hidden_state_projection + features_projection)
         # shape (N, H, W, attention_units) -> (N, H, W, 1)
         attention = self.attention_projector(projection, **kwargs)
-        # shape (N, H, W, 1) -> (N, H * W)
-        attention = self.flatten(attention)
-        attention = tf.nn.softmax(attention)
-        # shape (N, H * W) -> (N, H, W, 1)
-        attention_map = tf.reshape(attention, [-1, H, W, 1])
-        glimpse = tf.math.multiply(features, attention_map)
-        # shape (N, H * W) -> (N, C)
-        return tf.reduce_sum(glimpse, axis=[1, 2])
+        # softmax over the spatial positions: (N, H, W, 1) -> (N, H * W, 1) -> (N, H, W, 1)
+        attention_map = tf.reshape(tf.nn.softmax(tf.reshape(attention, [-1, H * W, 1]), axis=1), [-1, H, W, 1])
+        # shape (N, H, W, C), (N, H, W, 1) -> (N, C) without materializing the weighted features
+        return tf.einsum("nhwc,nhwk->nc", features, attention_map)
 
 
 class SARDecoder(layers.Layer, NestedObject):
@@ -149,9 +144,13 @@ class SARDecoder(layers.Layer, NestedObject):
             layers.LSTMCell(rnn_units, implementation=1) for _ in range(num_decoder_cells)
         ])
         self.attention_module = AttentionModule(attention_units)
-        self.output_dense = layers.Dense(self.vocab_size + 1, use_bias=True)
+        # Keep the logits in float32 under mixed precision policies
+        self.output_dense = layers.Dense(self.vocab_size + 1, use_bias=True, dtype="float32")
         self.dropout = layers.Dropout(dropout_prob)
 
+    # The autoregressive loop is traced into a single graph, which avoids dispatching each step eagerly.
+    # The batch size is read dynamically so that varying batch sizes relax the signature instead of retracing
+    @tf.function(reduce_retracing=True)
     def call(
         self,
         features: tf.Tensor,
@@ -163,18 +162,17 @@ class SARDecoder(layers.Layer, NestedObject):
             gt_embedding = self.embed_tgt(gt, **kwargs)
 
         logits_list: list[tf.Tensor] = []
+        batch_size = tf.shape(features)[0]
 
         for t in range(self.max_length + 1):  # 32
             if t == 0:
                 # step to init the first states of the LSTMCell
-                states = self.lstm_cells.get_initial_state(
-                    inputs=None, batch_size=features.shape[0], dtype=features.dtype
-                )
+                states = self.lstm_cells.get_initial_state(inputs=None, batch_size=batch_size, dtype=features.dtype)
                 prev_symbol = holistic
             elif t == 1:
                 # step to init a 'blank' sequence of length vocab_size + 1 filled with zeros
                 # (N, vocab_size + 1) --> (N, embedding_units)
-                prev_symbol = tf.zeros([features.shape[0], self.vocab_size + 1], dtype=features.dtype)
+                prev_symbol = tf.zeros([batch_size, self.vocab_size + 1], dtype=features.dtype)
                 prev_symbol = self.embed(prev_symbol, **kwargs)
             else:
                 if gt is not None and kwargs.get("training", False):
@@ -348,13 +346,10 @@ class SARPostProcessor(RecognitionPostProcessor):
         # Take the minimum confidence of the sequence
         probs = tf.math.reduce_min(probs, axis=1)
 
-        # decode raw output of the model with tf_label_to_idx
-        out_idxs = tf.cast(out_idxs, dtype="int32")
-        embedding = tf.constant(self._embedding, dtype=tf.string)
-        decoded_strings_pred = tf.strings.reduce_join(inputs=tf.nn.embedding_lookup(embedding, out_idxs), axis=-1)
-        decoded_strings_pred = tf.strings.split(decoded_strings_pred, "<eos>")
-        decoded_strings_pred = tf.sparse.to_dense(decoded_strings_pred.to_sparse(), default_value="not valid")[:, 0]
-        word_values = [word.decode() for word in decoded_strings_pred.numpy().tolist()]
+        # Manual decoding, cheaper than going through the TF string ops for the usual batch sizes
+        word_values = [
+            "".join(self._embedding[idx] for idx in encoded_seq).split("<eos>")[0] for encoded_seq in out_idxs.numpy()
+        ]
 
         return list(zip(word_values, probs.numpy().clip(0, 1).tolist()))
 
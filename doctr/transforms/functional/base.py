@@ -32,13 +32,16 @@ def crop_boxes(
         raise AssertionError("both the boxes and the crop need to have the same coordinate convention")
 
     xmin, ymin, xmax, ymax = crop_box
-    # Clip boxes & correct offset
-    boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(xmin, xmax) - xmin
-    boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(ymin, ymax) - ymin
+    # Clip boxes & correct offset (in place, on strided views of the x & y coords)
+    xs, ys = boxes[:, 0::2], boxes[:, 1::2]
+    np.clip(xs, xmin, xmax, out=xs)
+    np.clip(ys, ymin, ymax, out=ys)
+    xs -= xmin
+    ys -= ymin
     # Rescale relative coords
     if is_box_rel:
-        boxes[:, [0, 2]] /= xmax - xmin
-        boxes[:, [1, 3]] /= ymax - ymin
+        xs /= xmax - xmin
+        ys /= ymax - ymin
 
     # Remove 0-sized boxes
     is_valid = np.logical_and(boxes[:, 1] < boxes[:, 3], boxes[:, 0] < boxes[:, 2])
@@ -3,8 +3,6 @@
 # This program is licensed under the Apache License 2.0.
 # See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
 
-from copy import deepcopy
-
 import numpy as np
 import torch
 from torchvision.transforms import functional as F
@@ -26,7 +24,8 @@ def invert_colors(img: torch.Tensor, min_val: float = 0.6) -> torch.Tensor:
     Returns:
         the inverted image
     """
-    out = F.rgb_to_grayscale(img, num_output_channels=3)
+    # Single channel, the RGB shift broadcasts it to 3 channels
+    out = F.rgb_to_grayscale(img, num_output_channels=1)
     # Random RGB shift
     shift_shape = [img.shape[0], 3, 1, 1] if img.ndim == 4 else [3, 1, 1]
     rgb_shift = min_val + (1 - min_val) * torch.rand(shift_shape)
@@ -60,11 +59,11 @@ def rotate_sample(
     rotated_img = F.rotate(img, angle=angle, fill=0, expand=expand)  # Interpolation NEAREST by default
     rotated_img = rotated_img[:3]  # when expand=True, it expands to RGBA channels
     # Get absolute coords
-    _geoms = deepcopy(geoms)
+    _geoms = geoms.copy()
     if _geoms.shape[1:] == (4,):
         if np.max(_geoms) <= 1:
-            _geoms[:, [0, 2]] *= img.shape[-1]
-            _geoms[:, [1, 3]] *= img.shape[-2]
+            _geoms[:, 0::2] *= img.shape[-1]
+            _geoms[:, 1::2] *= img.shape[-2]
     elif _geoms.shape[1:] == (4, 2):
         if np.max(_geoms) <= 1:
             _geoms[..., 0] *= img.shape[-1]
@@ -81,10 +80,10 @@ def rotate_sample(
     ).astype(np.float32)
 
     # Always return relative boxes to avoid label confusions when resizing is performed aferwards
-    rotated_geoms[..., 0] = rotated_geoms[..., 0] / rotated_img.shape[2]
-    rotated_geoms[..., 1] = rotated_geoms[..., 1] / rotated_img.shape[1]
+    rotated_geoms[..., 0] /= rotated_img.shape[2]
+    rotated_geoms[..., 1] /= rotated_img.shape[1]
 
-    return rotated_img, np.clip(np.around(rotated_geoms, decimals=15), 0, 1)
+    return rotated_img, np.around(rotated_geoms, decimals=15, out=rotated_geoms).clip(0, 1, out=rotated_geoms)
 
 
 def crop_detection(
@@ -6,7 +6,6 @@
 import math
 import random
 from collections.abc import Iterable
-from copy import deepcopy
 
 import numpy as np
 import tensorflow as tf
@@ -115,11 +114,11 @@ def rotate_sample(
     rotated_img = rotated_img_tensor(img, angle, expand)
 
     # Get absolute coords
-    _geoms = deepcopy(geoms)
+    _geoms = geoms.copy()
     if _geoms.shape[1:] == (4,):
         if np.max(_geoms) <= 1:
-            _geoms[:, [0, 2]] *= img.shape[1]
-            _geoms[:, [1, 3]] *= img.shape[0]
+            _geoms[:, 0::2] *= img.shape[1]
+            _geoms[:, 1::2] *= img.shape[0]
     elif _geoms.shape[1:] == (4, 2):
         if np.max(_geoms) <= 1:
             _geoms[..., 0] *= img.shape[1]
@@ -131,10 +130,10 @@ def rotate_sample(
     rotated_geoms: np.ndarray = rotate_abs_geoms(_geoms, angle, img.shape[:-1], expand).astype(np.float32)
 
     # Always return relative boxes to avoid label confusions when resizing is performed aferwards
-    rotated_geoms[..., 0] = rotated_geoms[..., 0] / rotated_img.shape[1]
-    rotated_geoms[..., 1] = rotated_geoms[..., 1] / rotated_img.shape[0]
+    rotated_geoms[..., 0] /= rotated_img.shape[1]
+    rotated_geoms[..., 1] /= rotated_img.shape[0]
 
-    return rotated_img, np.clip(np.around(rotated_geoms, decimals=15), 0, 1)
+    return rotated_img, np.around(rotated_geoms, decimals=15, out=rotated_geoms).clip(0, 1, out=rotated_geoms)
 
 
 def crop_detection(
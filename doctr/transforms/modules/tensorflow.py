@@ -170,14 +170,15 @@ class Normalize(NestedObject):
     def __init__(self, mean: tuple[float, float, float], std: tuple[float, float, float]) -> None:
         self.mean = tf.constant(mean)
         self.std = tf.constant(std)
+        # (img - mean) / std is folded into a single multiply-add
+        self._scale = 1 / self.std
+        self._shift = -self.mean / self.std
 
     def extra_repr(self) -> str:
         return f"mean={self.mean.numpy().tolist()}, std={self.std.numpy().tolist()}"
 
     def __call__(self, img: tf.Tensor) -> tf.Tensor:
-        img -= tf.cast(self.mean, dtype=img.dtype)
-        img /= tf.cast(self.std, dtype=img.dtype)
-        return img
+        return img * tf.cast(self._scale, dtype=img.dtype) + tf.cast(self._shift, dtype=img.dtype)
 
 
 class LambdaTransformation(NestedObject):
@@ -174,13 +174,12 @@ def rotate_abs_geoms(
     Returns:
         A batch of rotated polygons (N, 4, 2)
     """
-    # Switch to polygons
+    # Switch to polygons (the corners are gathered at once)
     polys = (
-        np.stack([geoms[:, [0, 1]], geoms[:, [2, 1]], geoms[:, [2, 3]], geoms[:, [0, 3]]], axis=1)
+        geoms[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2).astype(np.float32, copy=False)
         if geoms.ndim == 2
-        else geoms
+        else geoms.astype(np.float32)
     )
-    polys = polys.astype(np.float32)
 
     # Switch to image center as referential
     polys[..., 0] -= img_shape[1] / 2
@@ -245,18 +244,8 @@ def rotate_boxes(
     Returns:
         A batch of rotated boxes (N, 4, 2): or a batch of straight bounding boxes
     """
-    # Change format of the boxes to rotated boxes
-    _boxes = loc_preds.copy()
-    if _boxes.ndim == 2:
-        _boxes = np.stack(
-            [
-                _boxes[:, [0, 1]],
-                _boxes[:, [2, 1]],
-                _boxes[:, [2, 3]],
-                _boxes[:, [0, 3]],
-            ],
-            axis=1,
-        )
+    # Change format of the boxes to rotated boxes (the fancy indexing already returns a copy)
+    _boxes = loc_preds[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2) if loc_preds.ndim == 2 else loc_preds.copy()
     # If small angle, return boxes (no rotation)
     if abs(angle) < min_angle or abs(angle) > 90 - min_angle:
         return _boxes
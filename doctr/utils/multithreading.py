@@ -6,7 +6,7 @@
 
 import multiprocessing as mp
 import os
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sized
 from multiprocessing.pool import ThreadPool
 from typing import Any
 
@@ -25,7 +25,8 @@ def multithread_exec(func: Callable[[Any], Any], seq: Iterable[Any], threads: in
     Args:
         func: function to be executed on each element of the iterable
         seq: iterable
-        threads: number of workers to be used for multiprocessing
+        threads: number of workers to be used for multiprocessing, capped at the length of `seq` when it is sized
+            (so that a single element is processed without starting a thread pool)
 
     Returns:
         iterator of the function's results using the iterable as inputs
@@ -36,6 +37,9 @@ def multithread_exec(func: Callable[[Any], Any], seq: Iterable[Any], threads: in
         you might want to disable multiprocessing. To achieve that, set 'DOCTR_MULTIPROCESSING_DISABLE' to 'TRUE'.
     """
     threads = threads if isinstance(threads, int) else min(16, mp.cpu_count())
+    # Don't spawn more threads than there are elements to process
+    if isinstance(seq, Sized):
+        threads = min(threads, len(seq))
     # Single-thread
     if threads < 2 or os.environ.get("DOCTR_MULTIPROCESSING_DISABLE", "").upper() in ENV_VARS_TRUE_VALUES:
         results = map(func, seq)
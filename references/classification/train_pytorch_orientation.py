@@ -213,6 +213,8 @@ def main(args):
         batch_size=args.batch_size,
         drop_last=False,
         num_workers=args.workers,
+        persistent_workers=args.workers > 0,
+        prefetch_factor=4 if args.workers > 0 else None,
         sampler=SequentialSampler(val_set),
         pin_memory=torch.cuda.is_available(),
     )
@@ -244,6 +246,11 @@ def main(args):
         torch.cuda.set_device(args.device)
         model = model.cuda()
 
+    if args.compile:
+        # Fused kernels for the forward/backward (compiling the forward keeps the plain state_dict keys)
+        torch.set_float32_matmul_precision("high")
+        model.forward = torch.compile(model.forward, mode="max-autotune" if torch.cuda.is_available() else "default")
+
     if args.test_only:
         print("Running evaluation")
         val_loss, acc = evaluate(model, val_loader, batch_transforms)
@@ -275,6 +282,8 @@ def main(args):
         batch_size=args.batch_size,
         drop_last=True,
         num_workers=args.workers,
+        persistent_workers=args.workers > 0,
+        prefetch_factor=4 if args.workers > 0 else None,
         sampler=RandomSampler(train_set),
         pin_memory=torch.cuda.is_available(),
     )
@@ -402,6 +411,7 @@ def parse_args():
     parser.add_argument("--export-onnx", dest="export_onnx", action="store_true", help="Export the model to ONNX")
     parser.add_argument("--sched", type=str, default="cosine", help="scheduler to use")
     parser.add_argument("--amp", dest="amp", help="Use Automatic Mixed Precision", action="store_true")
+    parser.add_argument("--compile", dest="compile", help="Compile the model with torch.compile", action="store_true")
     parser.add_argument("--find-lr", action="store_true", help="Gridsearch the optimal LR")
     parser.add_argument("--early-stop", action="store_true", help="Enable early stopping")
     parser.add_argument("--early-stop-epochs", type=int, default=5, help="Patience for early stopping")
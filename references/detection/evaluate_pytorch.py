@@ -35,7 +35,7 @@ def evaluate(model, val_loader, batch_transforms, val_metric, amp=False):
     val_loss, batch_cnt = 0, 0
     for images, targets in tqdm(val_loader):
         if torch.cuda.is_available():
-            images = images.cuda()
+            images = images.cuda(non_blocking=True).to(memory_format=torch.channels_last)
         images = batch_transforms(images)
         targets = [{CLASS_NAME: t} for t in targets]
         if amp:
@@ -135,7 +135,8 @@ def main(args):
         logging.warning("No accessible GPU, targe device set to CPU.")
     if torch.cuda.is_available():
         torch.cuda.set_device(args.device)
-        model = model.cuda()
+        # NHWC lets cuDNN pick the tensor core kernels for the convolutions
+        model = model.cuda().to(memory_format=torch.channels_last)
 
     # Metrics
     metric = LocalizationConfusion(use_polygons=args.rotation)
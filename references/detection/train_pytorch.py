@@ -61,7 +61,7 @@ def record_lr(
 
     for batch_idx, (images, targets) in enumerate(train_loader):
         if torch.cuda.is_available():
-            images = images.cuda()
+            images = images.cuda(non_blocking=True).to(memory_format=torch.channels_last)
 
         images = batch_transforms(images)
 
@@ -108,7 +108,7 @@ def fit_one_epoch(model, train_loader, batch_transforms, optimizer, scheduler, a
     pbar = tqdm(train_loader, position=1)
     for images, targets in pbar:
         if torch.cuda.is_available():
-            images = images.cuda()
+            images = images.cuda(non_blocking=True).to(memory_format=torch.channels_last)
         images = batch_transforms(images)
 
         optimizer.zero_grad()
@@ -143,7 +143,7 @@ def evaluate(model, val_loader, batch_transforms, val_metric, amp=False):
     val_loss, batch_cnt = 0, 0
     for images, targets in tqdm(val_loader):
         if torch.cuda.is_available():
-            images = images.cuda()
+            images = images.cuda(non_blocking=True).to(memory_format=torch.channels_last)
         images = batch_transforms(images)
         if amp:
             with torch.cuda.amp.autocast():
@@ -205,6 +205,8 @@ def main(args):
         batch_size=args.batch_size,
         drop_last=False,
         num_workers=args.workers,
+        persistent_workers=args.workers > 0,
+        prefetch_factor=4 if args.workers > 0 else None,
         sampler=SequentialSampler(val_set),
         pin_memory=torch.cuda.is_available(),
         collate_fn=val_set.collate_fn,
@@ -241,7 +243,13 @@ def main(args):
         logging.warning("No accessible GPU, target device set to CPU.")
     if torch.cuda.is_available():
         torch.cuda.set_device(args.device)
-        model = model.cuda()
+        # NHWC lets cuDNN pick the tensor core kernels for the convolutions
+        model = model.cuda().to(memory_format=torch.channels_last)
+
+    if args.compile:
+        # Fused kernels for the forward/backward (compiling the forward keeps the plain state_dict keys)
+        torch.set_float32_matmul_precision("high")
+        model.forward = torch.compile(model.forward, mode="max-autotune" if torch.cuda.is_available() else "default")
 
     # Metrics
     val_metric = LocalizationConfusion(use_polygons=args.rotation and not args.eval_straight)
@@ -312,6 +320,8 @@ def main(args):
         batch_size=args.batch_size,
         drop_last=True,
         num_workers=args.workers,
+        persistent_workers=args.workers > 0,
+        prefetch_factor=4 if args.workers > 0 else None,
         sampler=RandomSampler(train_set),
         pin_memory=torch.cuda.is_available(),
         collate_fn=train_set.collate_fn,
@@ -467,6 +477,7 @@ def parse_args():
         "--sched", type=str, default="poly", choices=["cosine", "onecycle", "poly"], help="scheduler to use"
     )
     parser.add_argument("--amp", dest="amp", help="Use Automatic Mixed Precision", action="store_true")
+    parser.add_argument("--compile", dest="compile", help="Compile the model with torch.compile", action="store_true")
     parser.add_argument("--find-lr", action="store_true", help="Gridsearch the optimal LR")
     parser.add_argument("--early-stop", action="store_true", help="Enable early stopping")
     parser.add_argument("--early-stop-epochs", type=int, default=5, help="Patience for early stopping")
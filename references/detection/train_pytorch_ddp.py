@@ -66,7 +66,7 @@ def record_lr(
 
     for batch_idx, (images, targets) in enumerate(train_loader):
         if torch.cuda.is_available():
-            images = images.cuda()
+            images = images.cuda(non_blocking=True).to(memory_format=torch.channels_last)
 
         images = batch_transforms(images)
 
@@ -113,7 +113,7 @@ def fit_one_epoch(model, train_loader, batch_transforms, optimizer, scheduler, a
     pbar = tqdm(train_loader, position=1)
     for images, targets in pbar:
         if torch.cuda.is_available():
-            images = images.cuda()
+            images = images.cuda(non_blocking=True).to(memory_format=torch.channels_last)
         images = batch_transforms(images)
 
         optimizer.zero_grad()
@@ -148,7 +148,7 @@ def evaluate(model, val_loader, batch_transforms, val_metric, args, amp=False):
     val_loss, batch_cnt = 0, 0
     for images, targets in tqdm(val_loader):
         if torch.cuda.is_available():
-            images = images.cuda()
+            images = images.cuda(non_blocking=True).to(memory_format=torch.channels_last)
         images = batch_transforms(images)
         if amp:
             with torch.cuda.amp.autocast():
@@ -219,6 +219,8 @@ def main(rank: int, world_size: int, args):
             batch_size=args.batch_size,
             drop_last=False,
             num_workers=args.workers,
+            persistent_workers=args.workers > 0,
+            prefetch_factor=4 if args.workers > 0 else None,
             sampler=SequentialSampler(val_set),
             pin_memory=torch.cuda.is_available(),
             collate_fn=val_set.collate_fn,
@@ -250,7 +252,12 @@ def main(rank: int, world_size: int, args):
     device = torch.device("cuda", args.devices[rank])
     dist.init_process_group(args.backend, rank=rank, world_size=world_size)
     # create local model
-    model = model.to(device)
+    # NHWC lets cuDNN pick the tensor core kernels for the convolutions
+    model = model.to(device, memory_format=torch.channels_last)
+    if args.compile:
+        # Fused kernels for the forward/backward (compiling the forward keeps the plain state_dict keys)
+        torch.set_float32_matmul_precision("high")
+        model.forward = torch.compile(model.forward, mode="max-autotune")
     # construct the DDP model
     model = DDP(model, device_ids=[device])
 
@@ -327,6 +334,8 @@ def main(rank: int, world_size: int, args):
         batch_size=args.batch_size,
         drop_last=True,
         num_workers=args.workers,
+        persistent_workers=args.workers > 0,
+        prefetch_factor=4 if args.workers > 0 else None,
         sampler=DistributedSampler(train_set, num_replicas=world_size, rank=rank, shuffle=False, drop_last=True),
         pin_memory=torch.cuda.is_available(),
         collate_fn=train_set.collate_fn,
@@ -492,6 +501,7 @@ def parse_args():
         "--sched", type=str, default="poly", choices=["cosine", "onecycle", "poly"], help="scheduler to use"
     )
     parser.add_argument("--amp", dest="amp", help="Use Automatic Mixed Precision", action="store_true")
+    parser.add_argument("--compile", dest="compile", help="Compile the model with torch.compile", action="store_true")
     parser.add_argument("--find-lr", action="store_true", help="Gridsearch the optimal LR")
     parser.add_argument("--early-stop", action="store_true", help="Enable early stopping")
     parser.add_argument("--early-stop-epochs", type=int, default=5, help="Patience for early stopping")
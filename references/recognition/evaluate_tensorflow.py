@@ -34,8 +34,7 @@ def evaluate(model, val_loader, batch_transforms, val_metric):
     val_metric.reset()
     # Validation loop
     val_loss, batch_cnt = 0, 0
-    val_iter = iter(val_loader)
-    for images, targets in tqdm(val_iter):
+    for images, targets in tqdm(val_loader):
         try:
             images = batch_transforms(images)
             out = model(images, target=targets, return_preds=True, training=False)
@@ -221,6 +221,8 @@ def main(args):
         batch_size=args.batch_size,
         drop_last=False,
         num_workers=args.workers,
+        persistent_workers=args.workers > 0,
+        prefetch_factor=4 if args.workers > 0 else None,
         sampler=SequentialSampler(val_set),
         pin_memory=torch.cuda.is_available(),
         collate_fn=val_set.collate_fn,
@@ -253,6 +255,11 @@ def main(args):
         torch.cuda.set_device(args.device)
         model = model.cuda()
 
+    if args.compile:
+        # Fused kernels for the forward/backward (compiling the forward keeps the plain state_dict keys)
+        torch.set_float32_matmul_precision("high")
+        model.forward = torch.compile(model.forward, mode="max-autotune" if torch.cuda.is_available() else "default")
+
     # Metrics
     val_metric = TextMatch()
 
@@ -322,6 +329,8 @@ def main(args):
         batch_size=args.batch_size,
         drop_last=True,
         num_workers=args.workers,
+        persistent_workers=args.workers > 0,
+        prefetch_factor=4 if args.workers > 0 else None,
         sampler=RandomSampler(train_set),
         pin_memory=torch.cuda.is_available(),
         collate_fn=train_set.collate_fn,
@@ -473,6 +482,7 @@ def parse_args():
     )
     parser.add_argument("--sched", type=str, default="cosine", help="scheduler to use")
     parser.add_argument("--amp", dest="amp", help="Use Automatic Mixed Precision", action="store_true")
+    parser.add_argument("--compile", dest="compile", help="Compile the model with torch.compile", action="store_true")
     parser.add_argument("--find-lr", action="store_true", help="Gridsearch the optimal LR")
     parser.add_argument("--early-stop", action="store_true", help="Enable early stopping")
     parser.add_argument("--early-stop-epochs", type=int, default=5, help="Patience for early stopping")
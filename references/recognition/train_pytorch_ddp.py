@@ -158,6 +158,8 @@ def main(rank: int, world_size: int, args):
             batch_size=args.batch_size,
             drop_last=False,
             num_workers=args.workers,
+            persistent_workers=args.workers > 0,
+            prefetch_factor=4 if args.workers > 0 else None,
             sampler=SequentialSampler(val_set),
             pin_memory=torch.cuda.is_available(),
             collate_fn=val_set.collate_fn,
@@ -185,6 +187,10 @@ def main(rank: int, world_size: int, args):
     dist.init_process_group(args.backend, rank=rank, world_size=world_size)
     # create local model
     model = model.to(device)
+    if args.compile:
+        # Fused kernels for the forward/backward (compiling the forward keeps the plain state_dict keys)
+        torch.set_float32_matmul_precision("high")
+        model.forward = torch.compile(model.forward, mode="max-autotune")
     # construct DDP model
     model = DDP(model, device_ids=[device])
 
@@ -260,6 +266,8 @@ def main(rank: int, world_size: int, args):
         batch_size=args.batch_size,
         drop_last=True,
         num_workers=args.workers,
+        persistent_workers=args.workers > 0,
+        prefetch_factor=4 if args.workers > 0 else None,
         sampler=DistributedSampler(train_set, num_replicas=world_size, rank=rank, shuffle=True, drop_last=True),
         pin_memory=torch.cuda.is_available(),
         collate_fn=train_set.collate_fn,
@@ -411,6 +419,7 @@ def parse_args():
     )
     parser.add_argument("--sched", type=str, default="cosine", help="scheduler to use")
     parser.add_argument("--amp", dest="amp", help="Use Automatic Mixed Precision", action="store_true")
+    parser.add_argument("--compile", dest="compile", help="Compile the model with torch.compile", action="store_true")
     parser.add_argument("--early-stop", action="store_true", help="Enable early stopping")
     parser.add_argument("--early-stop-epochs", type=int, default=5, help="Patience for early stopping")
     parser.add_argument("--early-stop-delta", type=float, default=0.01, help="Minimum Delta for early stopping")
@@ -93,9 +93,8 @@ def apply_grads(optimizer, grads, model):
 
 
 def fit_one_epoch(model, train_loader, batch_transforms, optimizer, amp=False):
-    train_iter = iter(train_loader)
     # Iterate over the batches of the dataset
-    pbar = tqdm(train_iter, position=1)
+    pbar = tqdm(train_loader, position=1)
     for images, targets in pbar:
         images = batch_transforms(images)
 
@@ -114,8 +113,7 @@ def evaluate(model, val_loader, batch_transforms, val_metric):
     val_metric.reset()
     # Validation loop
     val_loss, batch_cnt = 0, 0
-    val_iter = iter(val_loader)
-    for images, targets in tqdm(val_iter):
+    for images, targets in tqdm(val_loader):
         images = batch_transforms(images)
         out = model(images, target=targets, return_preds=True, training=False)
         # Compute metric
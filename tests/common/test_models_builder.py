@@ -193,6 +193,7 @@ def test_kiedocumentbuilder():
         [[[0, 0.5, 0.1, 0.6], [0.2, 0.49, 0.35, 0.59], [0.8, 0.52, 0.9, 0.63]], [0, 1, 2]],  # ~same line
         [[[0, 0.3, 0.4, 0.45], [0.5, 0.28, 0.75, 0.42], [0, 0.45, 0.1, 0.55]], [0, 1, 2]],  # 2 lines
         [[[0, 0.3, 0.4, 0.35], [0.75, 0.28, 0.95, 0.42], [0, 0.45, 0.1, 0.55]], [0, 1, 2]],  # 2 lines
+        [[[0.5, 0.3, 0.6, 0.3], [0, 0.1, 0.1, 0.1], [0, 0.3, 0.1, 0.3]], [1, 2, 0]],  # null heights
         [
             [
                 [[0.1, 0.1], [0.2, 0.2], [0.15, 0.25], [0.05, 0.15]],
@@ -10,8 +10,8 @@ def test_dbpostprocessor():
     postprocessor = DBPostProcessor(assume_straight_pages=True)
     r_postprocessor = DBPostProcessor(assume_straight_pages=False)
     with pytest.raises(AssertionError):
-        postprocessor(np.random.rand(2, 512, 512).astype(np.float32))
-    mock_batch = np.random.rand(2, 512, 512, 1).astype(np.float32)
+        postprocessor(np.random.rand(2, 128, 128).astype(np.float32))
+    mock_batch = np.random.rand(2, 128, 128, 1).astype(np.float32)
     out = postprocessor(mock_batch)
     r_out = r_postprocessor(mock_batch)
     # Batch composition
@@ -66,8 +66,8 @@ def test_linknet_postprocessor():
     postprocessor = LinkNetPostProcessor()
     r_postprocessor = LinkNetPostProcessor(assume_straight_pages=False)
     with pytest.raises(AssertionError):
-        postprocessor(np.random.rand(2, 512, 512).astype(np.float32))
-    mock_batch = np.random.rand(2, 512, 512, 1).astype(np.float32)
+        postprocessor(np.random.rand(2, 128, 128).astype(np.float32))
+    mock_batch = np.random.rand(2, 128, 128, 1).astype(np.float32)
     out = postprocessor(mock_batch)
     r_out = r_postprocessor(mock_batch)
     # Batch composition
@@ -84,8 +84,8 @@ def test_fast_postprocessor():
     postprocessor = FASTPostProcessor()
     r_postprocessor = FASTPostProcessor(assume_straight_pages=False)
     with pytest.raises(AssertionError):
-        postprocessor(np.random.rand(2, 512, 512).astype(np.float32))
-    mock_batch = np.random.rand(2, 512, 512, 1).astype(np.float32)
+        postprocessor(np.random.rand(2, 128, 128).astype(np.float32))
+    mock_batch = np.random.rand(2, 128, 128, 1).astype(np.float32)
     out = postprocessor(mock_batch)
     r_out = r_postprocessor(mock_batch)
     # Batch composition
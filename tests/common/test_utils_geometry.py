@@ -4,7 +4,6 @@ from math import hypot
 import numpy as np
 import pytest
 
-from doctr.io import DocumentFile
 from doctr.utils import geometry
 
 
@@ -40,7 +39,7 @@ def test_detach_scores():
 def test_resolve_enclosing_bbox():
     assert geometry.resolve_enclosing_bbox([((0, 0.5), (1, 0)), ((0.5, 0), (1, 0.25))]) == ((0, 0), (1, 0.5))
     pred = geometry.resolve_enclosing_bbox(np.array([[0.1, 0.1, 0.2, 0.2], [0.15, 0.15, 0.2, 0.2]]))
-    assert pred.all() == np.array([0.1, 0.1, 0.2, 0.2]).all()
+    np.testing.assert_allclose(pred, [0.1, 0.1, 0.2, 0.2])
 
 
 def test_resolve_enclosing_rbbox():
@@ -50,7 +49,7 @@ def test_resolve_enclosing_rbbox():
     ])
     target1 = np.asarray([[0.55, 0.65], [0.05, 0.15], [0.1, 0.1], [0.6, 0.6]])
     target2 = np.asarray([[0.05, 0.15], [0.1, 0.1], [0.6, 0.6], [0.55, 0.65]])
-    assert np.all(target1 - pred <= 1e-3) or np.all(target2 - pred <= 1e-3)
+    assert np.allclose(pred, target1, atol=1e-3) or np.allclose(pred, target2, atol=1e-3)
 
 
 def test_remap_boxes():
@@ -58,13 +57,13 @@ def test_remap_boxes():
         np.asarray([[[0.25, 0.25], [0.25, 0.75], [0.75, 0.25], [0.75, 0.75]]]), (10, 10), (20, 20)
     )
     target = np.asarray([[[0.375, 0.375], [0.375, 0.625], [0.625, 0.375], [0.625, 0.625]]])
-    assert np.all(pred == target)
+    assert np.array_equal(pred, target)
 
     pred = geometry.remap_boxes(
         np.asarray([[[0.25, 0.25], [0.25, 0.75], [0.75, 0.25], [0.75, 0.75]]]), (10, 10), (20, 10)
     )
     target = np.asarray([[[0.25, 0.375], [0.25, 0.625], [0.75, 0.375], [0.75, 0.625]]])
-    assert np.all(pred == target)
+    assert np.array_equal(pred, target)
 
     with pytest.raises(ValueError):
         geometry.remap_boxes(
@@ -146,11 +145,11 @@ def test_remove_image_padding():
     img = np.ones((32, 64, 3), dtype=np.float32)
     padded = np.pad(img, ((10, 10), (20, 20), (0, 0)))
     cropped = geometry.remove_image_padding(padded)
-    assert np.all(cropped == img)
+    assert np.array_equal(cropped, img)
 
     # No padding
     cropped = geometry.remove_image_padding(img)
-    assert np.all(cropped == img)
+    assert np.array_equal(cropped, img)
 
 
 @pytest.mark.parametrize(
@@ -175,7 +174,7 @@ def test_remove_image_padding():
     ],
 )
 def test_convert_to_relative_coords(abs_geoms, img_size, rel_geoms):
-    assert np.all(geometry.convert_to_relative_coords(abs_geoms, img_size) == rel_geoms)
+    assert np.array_equal(geometry.convert_to_relative_coords(abs_geoms, img_size), rel_geoms)
 
     # Wrong format
     with pytest.raises(ValueError):
@@ -197,25 +196,12 @@ def test_estimate_page_angle():
     assert angle == 0.0
 
 
-def test_extract_crops(mock_pdf):
-    doc_img = DocumentFile.from_pdf(mock_pdf)[0]
+def test_extract_crops(mock_pdf_pages):
+    doc_img = mock_pdf_pages[0]
     num_crops = 2
-    rel_boxes = np.array(
-        [[idx / num_crops, idx / num_crops, (idx + 1) / num_crops, (idx + 1) / num_crops] for idx in range(num_crops)],
-        dtype=np.float32,
-    )
-    abs_boxes = np.array(
-        [
-            [
-                int(idx * doc_img.shape[1] / num_crops),
-                int(idx * doc_img.shape[0]) / num_crops,
-                int((idx + 1) * doc_img.shape[1] / num_crops),
-                int((idx + 1) * doc_img.shape[0] / num_crops),
-            ]
-            for idx in range(num_crops)
-        ],
-        dtype=np.float32,
-    )
+    idx = np.arange(num_crops, dtype=np.float32)
+    rel_boxes = np.stack((idx, idx, idx + 1, idx + 1), axis=1) / num_crops
+    abs_boxes = np.floor(rel_boxes * np.array([doc_img.shape[1], doc_img.shape[0]] * 2, dtype=np.float32))
 
     with pytest.raises(AssertionError):
         geometry.extract_crops(doc_img, np.zeros((1, 5)))
@@ -229,16 +215,16 @@ def test_extract_crops(mock_pdf):
         assert all(crop.ndim == 3 for crop in croped_imgs)
 
     # Identity
-    assert np.all(
-        doc_img == geometry.extract_crops(doc_img, np.array([[0, 0, 1, 1]], dtype=np.float32), channels_last=True)[0]
+    assert np.array_equal(
+        doc_img, geometry.extract_crops(doc_img, np.array([[0, 0, 1, 1]], dtype=np.float32), channels_last=True)[0]
     )
     torch_img = np.transpose(doc_img, axes=(-1, 0, 1))
-    assert np.all(
-        torch_img
-        == np.transpose(
+    assert np.array_equal(
+        torch_img,
+        np.transpose(
             geometry.extract_crops(doc_img, np.array([[0, 0, 1, 1]], dtype=np.float32), channels_last=False)[0],
             axes=(-1, 0, 1),
-        )
+        ),
     )
 
     # No box
@@ -246,8 +232,8 @@ def test_extract_crops(mock_pdf):
 
 
 @pytest.mark.parametrize("assume_horizontal", [True, False])
-def test_extract_rcrops(mock_pdf, assume_horizontal):
-    doc_img = DocumentFile.from_pdf(mock_pdf)[0]
+def test_extract_rcrops(mock_pdf_pages, assume_horizontal):
+    doc_img = mock_pdf_pages[0]
     num_crops = 2
     rel_boxes = np.array(
         [
@@ -29,3 +29,10 @@ def test_multithread_exec_multiprocessing_disable():
     with patch.object(ThreadPool, "map") as mock_tp_map:
         multithread_exec(lambda x: x, [1, 2])
     assert not mock_tp_map.called
+
+
+def test_multithread_exec_single_element():
+    # No thread pool for a single element
+    with patch.object(ThreadPool, "map") as mock_tp_map:
+        assert list(multithread_exec(lambda x: 2 * x, [1])) == [2]
+    assert not mock_tp_map.called
@@ -1,3 +1,4 @@
+import copy
 import json
 import shutil
 import tempfile
@@ -11,6 +12,7 @@ import scipy.io as sio
 from PIL import Image
 
 from doctr.datasets.generator.base import synthesize_text_img
+from doctr.file_utils import is_torch_available
 from doctr.io import reader
 from doctr.utils import geometry
 
@@ -23,6 +25,31 @@ def mock_vocab():
     )
 
 
+@pytest.fixture(scope="module")
+def pretrained_recognition_model(mock_vocab):
+    from doctr.models import recognition
+
+    # Each model is loaded once per module. Its pretrained weights are restored and it is returned in eval mode
+    # for every test case, but other attributes (e.g. postprocessor, cfg) must not be mutated by the tests
+    models = {}
+
+    def _get_model(arch_name, input_shape):
+        key = (arch_name, tuple(input_shape))
+        if key not in models:
+            model = recognition.__dict__[arch_name](vocab=mock_vocab, pretrained=True, input_shape=input_shape)
+            weights = copy.deepcopy(model.state_dict()) if is_torch_available() else model.get_weights()
+            models[key] = (model, weights)
+        model, weights = models[key]
+        if is_torch_available():
+            model.load_state_dict(weights)
+            model.eval()
+        else:
+            model.set_weights(weights)
+        return model
+
+    return _get_model
+
+
 @pytest.fixture(scope="session")
 def mock_pdf(tmpdir_factory):
     # Page 1
@@ -42,6 +69,12 @@ def mock_pdf(tmpdir_factory):
     return str(fn)
 
 
+@pytest.fixture(scope="session")
+def mock_pdf_pages(mock_pdf):
+    # Decoded once for the whole session: tests must not modify the pages in place
+    return reader.DocumentFile.from_pdf(mock_pdf)
+
+
 @pytest.fixture(scope="session")
 def mock_payslip(tmpdir_factory):
     url = "https://3.bp.blogspot.com/-Es0oHTCrVEk/UnYA-iW9rYI/AAAAAAAAAFI/hWExrXFbo9U/s1600/003.jpg"
@@ -19,7 +19,7 @@ def _test_classification(model, input_shape, output_size, batch_size=2):
     # Output checks
     assert isinstance(out, torch.Tensor)
     assert out.dtype == torch.float32
-    assert out.numpy().shape == (batch_size, *output_size)
+    assert out.shape == (batch_size, *output_size)
     # Check FP16
     if torch.cuda.is_available():
         model = model.half().cuda()
@@ -19,16 +19,16 @@ from doctr.models.utils import export_model_to_onnx
 @pytest.mark.parametrize(
     "arch_name, input_shape, output_size, out_prob",
     [
-        ["db_resnet34", (3, 512, 512), (1, 512, 512), True],
-        ["db_resnet50", (3, 512, 512), (1, 512, 512), True],
-        ["db_mobilenet_v3_large", (3, 512, 512), (1, 512, 512), True],
-        ["linknet_resnet18", (3, 512, 512), (1, 512, 512), True],
-        ["linknet_resnet34", (3, 512, 512), (1, 512, 512), True],
-        ["linknet_resnet50", (3, 512, 512), (1, 512, 512), True],
-        ["fast_tiny", (3, 512, 512), (1, 512, 512), True],
-        ["fast_tiny_rep", (3, 512, 512), (1, 512, 512), True],  # Reparameterized model
-        ["fast_small", (3, 512, 512), (1, 512, 512), True],
-        ["fast_base", (3, 512, 512), (1, 512, 512), True],
+        ["db_resnet34", (3, 256, 256), (1, 256, 256), True],
+        ["db_resnet50", (3, 256, 256), (1, 256, 256), True],
+        ["db_mobilenet_v3_large", (3, 256, 256), (1, 256, 256), True],
+        ["linknet_resnet18", (3, 256, 256), (1, 256, 256), True],
+        ["linknet_resnet34", (3, 256, 256), (1, 256, 256), True],
+        ["linknet_resnet50", (3, 256, 256), (1, 256, 256), True],
+        ["fast_tiny", (3, 256, 256), (1, 256, 256), True],
+        ["fast_tiny_rep", (3, 256, 256), (1, 256, 256), True],  # Reparameterized model
+        ["fast_small", (3, 256, 256), (1, 256, 256), True],
+        ["fast_base", (3, 256, 256), (1, 256, 256), True],
     ],
 )
 def test_detection_models(arch_name, input_shape, output_size, out_prob, train_mode):
@@ -116,7 +116,7 @@ def test_detection_zoo(arch_name):
 
 
 def test_fast_reparameterization():
-    dummy_input = torch.rand((1, 3, 1024, 1024), dtype=torch.float32)
+    dummy_input = torch.rand((1, 3, 256, 256), dtype=torch.float32)
     base_model = detection.fast_tiny(pretrained=True, exportable=True).eval()
     base_model_params = sum(p.numel() for p in base_model.parameters())
     assert math.isclose(base_model_params, 13535296)  # base model params
@@ -148,16 +148,16 @@ def test_dilate():
 @pytest.mark.parametrize(
     "arch_name, input_shape, output_size",
     [
-        ["db_resnet34", (3, 512, 512), (1, 512, 512)],
-        ["db_resnet50", (3, 512, 512), (1, 512, 512)],
-        ["db_mobilenet_v3_large", (3, 512, 512), (1, 512, 512)],
-        ["linknet_resnet18", (3, 512, 512), (1, 512, 512)],
-        ["linknet_resnet34", (3, 512, 512), (1, 512, 512)],
-        ["linknet_resnet50", (3, 512, 512), (1, 512, 512)],
-        ["fast_tiny", (3, 512, 512), (1, 512, 512)],
-        ["fast_small", (3, 512, 512), (1, 512, 512)],
-        ["fast_base", (3, 512, 512), (1, 512, 512)],
-        ["fast_tiny_rep", (3, 512, 512), (1, 512, 512)],  # Reparameterized model
+        ["db_resnet34", (3, 256, 256), (1, 256, 256)],
+        ["db_resnet50", (3, 256, 256), (1, 256, 256)],
+        ["db_mobilenet_v3_large", (3, 256, 256), (1, 256, 256)],
+        ["linknet_resnet18", (3, 256, 256), (1, 256, 256)],
+        ["linknet_resnet34", (3, 256, 256), (1, 256, 256)],
+        ["linknet_resnet50", (3, 256, 256), (1, 256, 256)],
+        ["fast_tiny", (3, 256, 256), (1, 256, 256)],
+        ["fast_small", (3, 256, 256), (1, 256, 256)],
+        ["fast_base", (3, 256, 256), (1, 256, 256)],
+        ["fast_tiny_rep", (3, 256, 256), (1, 256, 256)],  # Reparameterized model
     ],
 )
 def test_models_onnx_export(arch_name, input_shape, output_size):
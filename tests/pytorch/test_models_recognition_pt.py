@@ -33,9 +33,9 @@ system_available_memory = int(psutil.virtual_memory().available / 1024**3)
         ["parseq", (3, 32, 128)],
     ],
 )
-def test_recognition_models(arch_name, input_shape, train_mode, mock_vocab):
+def test_recognition_models(arch_name, input_shape, train_mode, pretrained_recognition_model):
     batch_size = 4
-    model = recognition.__dict__[arch_name](vocab=mock_vocab, pretrained=True, input_shape=input_shape)
+    model = pretrained_recognition_model(arch_name, input_shape)
     model = model.train() if train_mode else model.eval()
     assert isinstance(model, torch.nn.Module)
     input_tensor = torch.rand((batch_size, *input_shape))
@@ -35,7 +35,12 @@ class _DummyCallback:
     ],
 )
 def test_ocrpredictor(
-    mock_pdf, mock_vocab, assume_straight_pages, straighten_pages, disable_page_orientation, disable_crop_orientation
+    mock_pdf_pages,
+    mock_vocab,
+    assume_straight_pages,
+    straighten_pages,
+    disable_page_orientation,
+    disable_crop_orientation,
 ):
     det_bsize = 4
     det_predictor = DetectionPredictor(
@@ -57,7 +62,7 @@ def test_ocrpredictor(
 
     assert not reco_predictor.model.training
 
-    doc = DocumentFile.from_pdf(mock_pdf)
+    doc = mock_pdf_pages
 
     predictor = OCRPredictor(
         det_predictor,
@@ -190,7 +195,12 @@ def test_trained_ocr_predictor(mock_payslip):
     ],
 )
 def test_kiepredictor(
-    mock_pdf, mock_vocab, assume_straight_pages, straighten_pages, disable_page_orientation, disable_crop_orientation
+    mock_pdf_pages,
+    mock_vocab,
+    assume_straight_pages,
+    straighten_pages,
+    disable_page_orientation,
+    disable_crop_orientation,
 ):
     det_bsize = 4
     det_predictor = DetectionPredictor(
@@ -212,7 +222,7 @@ def test_kiepredictor(
 
     assert not reco_predictor.model.training
 
-    doc = DocumentFile.from_pdf(mock_pdf)
+    doc = mock_pdf_pages
 
     predictor = KIEPredictor(
         det_predictor,
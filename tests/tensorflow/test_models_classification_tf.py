@@ -44,7 +44,7 @@ def test_classification_architectures(arch_name, input_shape, output_size):
     # Output checks
     assert isinstance(out, tf.Tensor)
     assert out.dtype == tf.float32
-    assert out.numpy().shape == (batch_size, *output_size)
+    assert out.shape == (batch_size, *output_size)
     # Check that you can load pretrained up to the classification layer with differing number of classes to fine-tune
     tf.keras.backend.clear_session()
     assert classification.__dict__[arch_name](
@@ -24,15 +24,15 @@ system_available_memory = int(psutil.virtual_memory().available / 1024**3)
 @pytest.mark.parametrize(
     "arch_name, input_shape, output_size, out_prob",
     [
-        ["db_resnet50", (512, 512, 3), (512, 512, 1), True],
-        ["db_mobilenet_v3_large", (512, 512, 3), (512, 512, 1), True],
-        ["linknet_resnet18", (512, 512, 3), (512, 512, 1), True],
-        ["linknet_resnet34", (512, 512, 3), (512, 512, 1), True],
-        ["linknet_resnet50", (512, 512, 3), (512, 512, 1), True],
-        ["fast_tiny", (512, 512, 3), (512, 512, 1), True],
-        ["fast_tiny_rep", (512, 512, 3), (512, 512, 1), True],  # Reparameterized model
-        ["fast_small", (512, 512, 3), (512, 512, 1), True],
-        ["fast_base", (512, 512, 3), (512, 512, 1), True],
+        ["db_resnet50", (256, 256, 3), (256, 256, 1), True],
+        ["db_mobilenet_v3_large", (256, 256, 3), (256, 256, 1), True],
+        ["linknet_resnet18", (256, 256, 3), (256, 256, 1), True],
+        ["linknet_resnet34", (256, 256, 3), (256, 256, 1), True],
+        ["linknet_resnet50", (256, 256, 3), (256, 256, 1), True],
+        ["fast_tiny", (256, 256, 3), (256, 256, 1), True],
+        ["fast_tiny_rep", (256, 256, 3), (256, 256, 1), True],  # Reparameterized model
+        ["fast_small", (256, 256, 3), (256, 256, 1), True],
+        ["fast_base", (256, 256, 3), (256, 256, 1), True],
     ],
 )
 def test_detection_models(arch_name, input_shape, output_size, out_prob, train_mode):
@@ -172,7 +172,7 @@ def test_detection_zoo_error():
 
 
 def test_fast_reparameterization():
-    dummy_input = tf.random.uniform(shape=[1, 1024, 1024, 3], minval=0, maxval=1)
+    dummy_input = tf.random.uniform(shape=[1, 256, 256, 3], minval=0, maxval=1)
     base_model = detection.fast_tiny(pretrained=True, exportable=True)
     base_model_params = np.sum([np.prod(v.shape) for v in base_model.trainable_variables])
     assert math.isclose(base_model_params, 13535296)  # base model params
@@ -207,33 +207,33 @@ def test_dilate():
 @pytest.mark.parametrize(
     "arch_name, input_shape, output_size",
     [
-        ["db_mobilenet_v3_large", (512, 512, 3), (512, 512, 1)],
-        ["linknet_resnet18", (1024, 1024, 3), (1024, 1024, 1)],
-        ["fast_tiny", (1024, 1024, 3), (1024, 1024, 1)],
-        ["fast_tiny_rep", (1024, 1024, 3), (1024, 1024, 1)],  # Reparameterized model
-        ["fast_small", (1024, 1024, 3), (1024, 1024, 1)],
+        ["db_mobilenet_v3_large", (256, 256, 3), (256, 256, 1)],
+        ["linknet_resnet18", (256, 256, 3), (256, 256, 1)],
+        ["fast_tiny", (256, 256, 3), (256, 256, 1)],
+        ["fast_tiny_rep", (256, 256, 3), (256, 256, 1)],  # Reparameterized model
+        ["fast_small", (256, 256, 3), (256, 256, 1)],
         pytest.param(
             "db_resnet50",
-            (512, 512, 3),
-            (512, 512, 1),
+            (256, 256, 3),
+            (256, 256, 1),
             marks=pytest.mark.skipif(system_available_memory < 16, reason="too less memory"),
         ),
         pytest.param(
             "linknet_resnet34",
-            (1024, 1024, 3),
-            (1024, 1024, 1),
+            (256, 256, 3),
+            (256, 256, 1),
             marks=pytest.mark.skipif(system_available_memory < 16, reason="too less memory"),
         ),
         pytest.param(
             "linknet_resnet50",
-            (512, 512, 3),
-            (512, 512, 1),
+            (256, 256, 3),
+            (256, 256, 1),
             marks=pytest.mark.skipif(system_available_memory < 16, reason="too less memory"),
         ),
         pytest.param(
             "fast_base",
-            (512, 512, 3),
-            (512, 512, 1),
+            (256, 256, 3),
+            (256, 256, 1),
             marks=pytest.mark.skipif(system_available_memory < 16, reason="too less memory"),
         ),
     ],
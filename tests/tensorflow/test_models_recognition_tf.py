@@ -8,7 +8,6 @@ import psutil
 import pytest
 import tensorflow as tf
 
-from doctr.io import DocumentFile
 from doctr.models import recognition
 from doctr.models.preprocessor import PreProcessor
 from doctr.models.recognition.crnn.tensorflow import CTCPostProcessor
@@ -37,9 +36,9 @@ system_available_memory = int(psutil.virtual_memory().available / 1024**3)
         ["parseq", (32, 128, 3)],
     ],
 )
-def test_recognition_models(arch_name, input_shape, train_mode, mock_vocab):
+def test_recognition_models(arch_name, input_shape, train_mode, pretrained_recognition_model):
     batch_size = 4
-    reco_model = recognition.__dict__[arch_name](vocab=mock_vocab, pretrained=True, input_shape=input_shape)
+    reco_model = pretrained_recognition_model(arch_name, input_shape)
     assert isinstance(reco_model, tf.keras.Model)
     input_tensor = tf.random.uniform(shape=[batch_size, *input_shape], minval=0, maxval=1)
     target = ["i", "am", "a", "jedi"]
@@ -65,6 +64,22 @@ def test_recognition_models(arch_name, input_shape, train_mode, mock_vocab):
         reco_model(input_tensor, None, training=True)
 
 
+def test_sar_decoder_batch_sizes():
+    model = recognition.sar_resnet31(input_shape=(32, 128, 3))
+    for batch_size in (2, 3):
+        input_tensor = tf.random.uniform(shape=[batch_size, 32, 128, 3], minval=0, maxval=1)
+        out = model(input_tensor, return_model_output=True, training=False)["out_map"]
+        tf.config.run_functions_eagerly(True)
+        try:
+            eager_out = model(input_tensor, return_model_output=True, training=False)["out_map"]
+        finally:
+            tf.config.run_functions_eagerly(False)
+        assert out.shape[0] == batch_size
+        assert np.allclose(out.numpy(), eager_out.numpy(), atol=1e-5)
+    # A new batch size relaxes the traced signature instead of tracing the unrolled loop once per batch size
+    assert model.decoder.call.experimental_get_tracing_count() <= 2
+
+
 @pytest.mark.parametrize(
     "post_processor, input_shape",
     [
@@ -87,14 +102,14 @@ def test_reco_postprocessors(post_processor, input_shape, mock_vocab):
 
 
 @pytest.fixture(scope="session")
-def test_recognitionpredictor(mock_pdf, mock_vocab):
+def test_recognitionpredictor(mock_pdf_pages, mock_vocab):
     batch_size = 4
     predictor = RecognitionPredictor(
         PreProcessor(output_size=(32, 128), batch_size=batch_size, preserve_aspect_ratio=True),
         recognition.crnn_vgg16_bn(vocab=mock_vocab, input_shape=(32, 128, 3)),
     )
 
-    pages = DocumentFile.from_pdf(mock_pdf)
+    pages = mock_pdf_pages
     # Create bounding boxes
     boxes = np.array([[0.5, 0.5, 0.75, 0.75], [0.5, 0.5, 1.0, 1.0]], dtype=np.float32)
     crops = extract_crops(pages[0], boxes)
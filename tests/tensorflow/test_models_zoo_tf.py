@@ -35,7 +35,12 @@ class _DummyCallback:
     ],
 )
 def test_ocrpredictor(
-    mock_pdf, mock_vocab, assume_straight_pages, straighten_pages, disable_page_orientation, disable_crop_orientation
+    mock_pdf_pages,
+    mock_vocab,
+    assume_straight_pages,
+    straighten_pages,
+    disable_page_orientation,
+    disable_crop_orientation,
 ):
     det_bsize = 4
     det_predictor = DetectionPredictor(
@@ -54,7 +59,7 @@ def test_ocrpredictor(
         recognition.crnn_vgg16_bn(pretrained=False, pretrained_backbone=False, vocab=mock_vocab),
     )
 
-    doc = DocumentFile.from_pdf(mock_pdf)
+    doc = mock_pdf_pages
 
     predictor = OCRPredictor(
         det_predictor,
@@ -189,7 +194,12 @@ def test_trained_ocr_predictor(mock_payslip):
     ],
 )
 def test_kiepredictor(
-    mock_pdf, mock_vocab, assume_straight_pages, straighten_pages, disable_page_orientation, disable_crop_orientation
+    mock_pdf_pages,
+    mock_vocab,
+    assume_straight_pages,
+    straighten_pages,
+    disable_page_orientation,
+    disable_crop_orientation,
 ):
     det_bsize = 4
     det_predictor = DetectionPredictor(
@@ -208,7 +218,7 @@ def test_kiepredictor(
         recognition.crnn_vgg16_bn(pretrained=False, pretrained_backbone=False, vocab=mock_vocab),
     )
 
-    doc = DocumentFile.from_pdf(mock_pdf)
+    doc = mock_pdf_pages
 
     predictor = KIEPredictor(
         det_predictor,